@@ -1,3 +1,6 @@
+from functools import lru_cache
+
+
 #: The version of beanbag_docutils.
 #:
 #: This is in the format of:
@@ -6,47 +9,63 @@
 #:
 VERSION = (2, 3, 1, 'alpha', 0, False)
 
+#: Whether this is a released version of the package.
+#:
+#: This is equivalent to calling :py:func:`is_release`.
+#:
+#: Version Added:
+#:     2.3.1
+RELEASED = VERSION[5]
 
+
+@lru_cache(maxsize=1)
 def get_version_string():
     """Return the version as a human-readable string.
 
+    The result is computed once and cached, since :py:data:`VERSION` is
+    constant.
+
     Returns:
         unicode:
         The version number as a human-readable string.
     """
-    version = '%s.%s' % (VERSION[0], VERSION[1])
+    parts = ['%s.%s' % (VERSION[0], VERSION[1])]
 
     if VERSION[2]:
-        version += ".%s" % VERSION[2]
+        parts.append('.%s' % VERSION[2])
 
     if VERSION[3] != 'final':
         if VERSION[3] == 'rc':
-            version += ' RC%s' % VERSION[4]
+            parts.append(' RC%s' % VERSION[4])
         else:
-            version += ' %s %s' % (VERSION[3], VERSION[4])
+            parts.append(' %s %s' % (VERSION[3], VERSION[4]))
 
-    if not is_release():
-        version += " (dev)"
+    if not RELEASED:
+        parts.append(' (dev)')
 
-    return version
+    return ''.join(parts)
 
 
+@lru_cache(maxsize=1)
 def get_package_version():
     """Return the version as a Python package version string.
 
+    The result is computed once and cached, since :py:data:`VERSION` is
+    constant.
+
     Returns:
         unicode:
         The version number as used in a Python package.
     """
-    version = '%s.%s' % (VERSION[0], VERSION[1])
+    parts = ['%s.%s' % (VERSION[0], VERSION[1])]
 
     if VERSION[2]:
-        version += ".%s" % VERSION[2]
+        parts.append('.%s' % VERSION[2])
 
     if VERSION[3] != 'final':
-        version += '%s%s' % (VERSION[3], VERSION[4])
+        parts.append('%s%s' % (VERSION[3], VERSION[4]))
 
-    return version
+    return ''.join(parts)
 
 
 def is_release():
@@ -56,7 +75,7 @@ def is_release():
         bool:
         ``True`` if this is a released version of the package.
     """
-    return VERSION[5]
+    return RELEASED
 
 
 #: An alias for the the version information from :py:data:`VERSION`.
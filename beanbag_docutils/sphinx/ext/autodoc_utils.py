@@ -146,6 +146,9 @@ Configuration
 
 import re
 import sys
+from functools import lru_cache
+from itertools import islice
+from weakref import WeakKeyDictionary
 
 from sphinx import version_info
 from sphinx.ext.napoleon.docstring import GoogleDocstring
@@ -156,13 +159,143 @@ try:
     from sphinx.ext.napoleon.docstring import _convert_type_spec
 except ImportError:
     def _convert_type_spec(type_part, type_aliases):
-        try:
+        if type_part in type_aliases:
             return type_aliases[type_part]
-        except KeyError:
-            if type_part == 'None':
-                return ':obj:`None`'
+        elif type_part == 'None':
+            return ':obj:`None`'
+        else:
+            return ':class:`%s`' % type_part
+
+
+@lru_cache(maxsize=4096)
+def _convert_unaliased_type_spec(type_part):
+    """Convert a type to a reference, without consulting type aliases.
+
+    The same types appear over and over across a codebase's docstrings, so
+    the results are cached. Type aliases are configurable and can't be
+    safely cached here, so callers must check those first.
+
+    Args:
+        type_part (unicode):
+            The type to convert.
+
+    Returns:
+        unicode:
+        The type reference.
+    """
+    return _convert_type_spec(type_part, {})
+
+
+#: The default wildcard excludes, used when ``__defaults__`` is set.
+_DEFAULT_WILDCARD_EXCLUDES = frozenset({
+    '__annotations__',
+    '__dict__',
+    '__doc__',
+    '__module__',
+    '__weakref__',
+})
+
+#: An empty set of excludes, used when a key isn't in ``autodoc_excludes``.
+_EMPTY_EXCLUDES = frozenset()
+
+#: Types of objects whose docstrings may begin with an inline type.
+#:
+#: Napoleon reformats these docstrings even if they have no sections.
+_INLINE_TYPE_WHATS = frozenset({'attribute', 'data', 'property'})
+
+#: Words in a type string that aren't converted to type references.
+_TYPE_CONNECTOR_WORDS = frozenset({'of', 'or'})
+
+
+#: A cache of type references for each Sphinx configuration.
+#:
+#: Each configuration maps to a dictionary of type strings to the results of
+#: :py:meth:`BeanbagDocstring.make_type_reference`.
+_type_references_cache = WeakKeyDictionary()
+
+#: A cache of module names to their combined excludes and deprecations.
+_module_excludes_cache = {}
+
+
+def _skip_parse():
+    """Skip parsing a docstring.
+
+    This is temporarily set as a :py:class:`BeanbagDocstring` instance's
+    ``_parse()`` method while the parent class is being initialized.
+    """
+    pass
+
+
+def _is_partial_typed_arg_start(line):
+    """Return whether a line may start a typed argument.
+
+    This is equivalent to matching the default
+    :py:attr:`BeanbagDocstring.partial_typed_arg_start_re`, but without the
+    backtracking. That pattern matches any line with a ``(`` after the first
+    character that's followed by something other than whitespace.
+
+    Args:
+        line (unicode):
+            The line to check.
+
+    Returns:
+        bool:
+        ``True`` if the line may start a typed argument.
+    """
+    i = line.find('(', 1)
+
+    return i != -1 and bool(line[i + 1:].strip())
+
+
+def _is_partial_typed_arg_end(line):
+    """Return whether a line may end a typed argument.
+
+    This is equivalent to matching the default
+    :py:attr:`BeanbagDocstring.partial_typed_arg_end_re`.
+
+    Args:
+        line (unicode):
+            The line to check.
+
+    Returns:
+        bool:
+        ``True`` if the line may end a typed argument.
+    """
+    return len(line) > 2 and line.endswith('):')
+
+
+def _join_typed_arg_lines(lines):
+    """Join the lines of a typed argument that wraps across lines.
+
+    We have to be careful to join them in such a way where we have a space
+    in-between if separating words, but not if separating parts of a class
+    name.
+
+    Args:
+        lines (list of unicode):
+            The lines making up the typed argument.
+
+    Returns:
+        unicode:
+        The joined line.
+    """
+    parts = [lines[0]]
+    append = parts.append
+    prev_line = lines[0].strip()
+
+    for line in lines[1:]:
+        norm_line = line.strip()
+
+        if norm_line:
+            if norm_line[0] == '.' or prev_line[-1:] == '.':
+                line = norm_line
             else:
-                return ':class:`%s`' % type_part
+                append(' ')
+
+        append(line)
+        prev_line = norm_line
+
+    return ''.join(parts)
 
 
 class BeanbagDocstring(GoogleDocstring):
@@ -180,8 +313,21 @@ class BeanbagDocstring(GoogleDocstring):
       for long module paths.
     """
 
+    #: A pattern that matches lines that may start a typed argument.
+    #:
+    #: Version Changed:
+    #:     2.3.1:
+    #:     Lines are checked without this pattern unless a subclass overrides
+    #:     it or :py:attr:`partial_typed_arg_end_re`.
     partial_typed_arg_start_re = \
         re.compile(r'\s*(.+?)\s*\(\s*(.*[^\s]+)\s*[^:)]*$')
+
+    #: A pattern that matches lines that may end a typed argument.
+    #:
+    #: Version Changed:
+    #:     2.3.1:
+    #:     Lines are checked without this pattern unless a subclass overrides
+    #:     it or :py:attr:`partial_typed_arg_start_re`.
     partial_typed_arg_end_re = re.compile(r'\s*(.+?)\s*\):$')
 
     extra_returns_sections = [
@@ -210,6 +356,11 @@ class BeanbagDocstring(GoogleDocstring):
 
     _USES_LINES_DEQUE = (version_info[:2] >= (5, 1))
 
+    #: The cached type references for this docstring's configuration.
+    #:
+    #: This is set by :py:meth:`make_type_reference` when first needed.
+    _type_references = None
+
     def __init__(self, *args, **kwargs):
         """Initialize the parser.
 
@@ -220,18 +371,103 @@ class BeanbagDocstring(GoogleDocstring):
             **kwargs (dict):
                 Keyword arguments for the parent.
         """
+        # The parent class parses the docstring at the end of its
+        # constructor, before we've had a chance to register our sections.
+        # Shadow _parse() with a no-op on the instance until we're ready.
+        self._parse = _skip_parse
+
         super(BeanbagDocstring, self).__init__(*args, **kwargs)
 
-        for keyword, label, options in self.extra_returns_sections:
-            self.register_returns_section(keyword, label, options)
+        del self._parse
+
+        if self._has_default_registration():
+            # All the extra sections share a single bound handler, which
+            # looks up the section's parser and arguments in the class-wide
+            # table. This avoids building closures for every section on
+            # every docstring.
+            self._sections.update(dict.fromkeys(self._get_extra_sections(),
+                                                self._parse_extra_section))
+        else:
+            # A subclass has customized how sections are registered, so
+            # register each section through those methods.
+            for keyword, label, options in self.extra_returns_sections:
+                self.register_returns_section(keyword, label, options)
+
+            for keyword, label in self.extra_fields_sections:
+                self.register_fields_section(keyword, label)
+
+            for keyword, admonition in self.extra_version_info_sections:
+                self.register_version_info_section(keyword, admonition)
+
+        self._parse()
+
+    @classmethod
+    def _has_default_registration(cls):
+        """Return whether this class uses the default section registration.
+
+        This is ``False`` if a subclass overrides any of
+        :py:meth:`register_returns_section`,
+        :py:meth:`register_fields_section`, or
+        :py:meth:`register_version_info_section`. The result is cached on
+        the class.
+
+        Returns:
+            bool:
+            ``True`` if the extra sections can be registered from the
+            class-wide table.
+        """
+        try:
+            return cls.__dict__['_default_registration']
+        except KeyError:
+            pass
+
+        default_registration = all(
+            getattr(cls, name) is getattr(BeanbagDocstring, name)
+            for name in ('register_returns_section',
+                         'register_fields_section',
+                         'register_version_info_section')
+        )
+        cls._default_registration = default_registration
+
+        return default_registration
+
+    @classmethod
+    def _get_extra_sections(cls):
+        """Return the table of extra sections for this class.
+
+        This is built from :py:attr:`extra_returns_sections`,
+        :py:attr:`extra_fields_sections`, and
+        :py:attr:`extra_version_info_sections` the first time it's needed
+        for a class, and then cached on that class.
+
+        Returns:
+            dict:
+            A mapping of section keywords to tuples of the unbound parser
+            method and the positional arguments to pass to it.
+        """
+        try:
+            return cls.__dict__['_extra_sections']
+        except KeyError:
+            pass
+
+        extra_sections = {}
 
-        for keyword, label in self.extra_fields_sections:
-            self.register_fields_section(keyword, label)
+        for keyword, label, options in cls.extra_returns_sections:
+            extra_sections[keyword] = (cls._parse_extra_returns_section,
+                                       (label, options))
 
-        for keyword, admonition in self.extra_version_info_sections:
-            self.register_version_info_section(keyword, admonition)
+        for keyword, label in cls.extra_fields_sections:
+            extra_sections[keyword] = (cls._parse_extra_fields_section,
+                                       (label,))
 
-        self._parse(True)
+        for keyword, admonition in cls.extra_version_info_sections:
+            extra_sections[keyword] = (
+                cls._parse_extra_version_info_section,
+                (admonition,))
+
+        cls._extra_sections = extra_sections
+
+        return extra_sections
 
     def register_returns_section(self, keyword, label, options={}):
         """Register a Returns-like section with the given keyword and label.
@@ -257,9 +493,7 @@ class BeanbagDocstring(GoogleDocstring):
                     2.0
         """
         self._sections[keyword] = lambda *args: \
-            self._format_fields(
-                label,
-                self._consume_returns_section(**options))
+            self._parse_extra_returns_section(label, options)
 
     def register_fields_section(self, keyword, label):
         """Register a fields section with the given keyword and label.
@@ -272,7 +506,7 @@ class BeanbagDocstring(GoogleDocstring):
                 The label outputted in the section.
         """
         self._sections[keyword] = lambda *args: \
-            self._format_fields(label, self._consume_fields())
+            self._parse_extra_fields_section(label)
 
     def register_version_info_section(self, keyword, admonition):
         """Register a version section with the given keyword and admonition.
@@ -285,9 +519,68 @@ class BeanbagDocstring(GoogleDocstring):
                 The admonition to use for the section.
         """
         self._sections[keyword] = lambda *args: \
-            self._format_admonition_with_params(
-                admonition,
-                self._consume_to_next_section())
+            self._parse_extra_version_info_section(admonition)
+
+    def _parse_extra_section(self, section):
+        """Parse one of the extra sections defined on the class.
+
+        Args:
+            section (unicode):
+                The name of the section, as found in the docstring.
+
+        Returns:
+            list of unicode:
+            The resulting list of lines.
+        """
+        parser, parser_args = self._get_extra_sections()[section.lower()]
+
+        return parser(self, *parser_args)
+
+    def _parse_extra_returns_section(self, label, options):
+        """Parse a Returns-like section.
+
+        Args:
+            label (unicode):
+                The label outputted in the section.
+
+            options (dict):
+                Options for the section. See
+                :py:meth:`register_returns_section`.
+
+        Returns:
+            list of unicode:
+            The resulting list of lines.
+        """
+        return self._format_fields(label,
+                                   self._consume_returns_section(**options))
+
+    def _parse_extra_fields_section(self, label):
+        """Parse a fields section.
+
+        Args:
+            label (unicode):
+                The label outputted in the section.
+
+        Returns:
+            list of unicode:
+            The resulting list of lines.
+        """
+        return self._format_fields(label, self._consume_fields())
+
+    def _parse_extra_version_info_section(self, admonition):
+        """Parse a version section.
+
+        Args:
+            admonition (unicode):
+                The admonition to use for the section.
+
+        Returns:
+            list of unicode:
+            The resulting list of lines.
+        """
+        return self._format_admonition_with_params(
+            admonition,
+            self._consume_to_next_section())
 
     def _format_admonition_with_params(self, admonition, lines):
         """Format an admonition section with the first line as a parameter.
@@ -311,27 +604,45 @@ class BeanbagDocstring(GoogleDocstring):
             if param_line.endswith(':'):
                 param_line = param_line[:-1]
 
-            return (
-                ['.. %s:: %s' % (admonition, param_line), ''] +
-                self._indent(self._dedent(lines[1:]), 3) + ['']
-            )
+            # Dedent and re-indent the content in one pass, rather than
+            # building intermediate lists through _dedent() and _indent().
+            content_lines = lines[1:]
+            min_indent = self._get_min_indent(content_lines)
+
+            result = ['.. %s:: %s' % (admonition, param_line), '']
+            result += [
+                '   %s' % line[min_indent:]
+                for line in content_lines
+            ]
+            result.append('')
+
+            return result
         else:
             return ['.. %s::' % admonition, '']
 
-    def _parse(self, parse=False):
+    def _parse(self):
         """Parse the docstring.
 
-        By default (when called from the parent class), this won't do anything.
-        It requires passing ``True`` in order to parse. This is there to
-        prevent the parent class from prematurely parsing before all sections
-        are rendered.
-
-        Args:
-            parse (bool, optional):
-                Set whether the parsing should actually happen.
+        If the docstring has no section headers, Napoleon's parser would
+        pass the lines through unchanged, so this will skip the parser and
+        use the lines directly. Otherwise, this parses as normal.
         """
-        if parse:
-            super(BeanbagDocstring, self)._parse()
+        if (self._USES_LINES_DEQUE and
+            not (self._name and self._what in _INLINE_TYPE_WHATS) and
+            not getattr(self, '_directive_sections', None)):
+            sections = self._sections
+
+            for line in self._lines:
+                if (line.endswith(':') and
+                    line.lower().strip(':') in sections):
+                    break
+            else:
+                # There are no sections to parse.
+                self._parsed_lines = list(self._lines)
+                self._lines.clear()
+                return
+
+        super(BeanbagDocstring, self)._parse()
 
     def _consume_field(self, parse_type=True, *args, **kwargs):
         """Parse a field line and return the field's information.
@@ -355,65 +666,55 @@ class BeanbagDocstring(GoogleDocstring):
             method.
         """
         if parse_type:
-            lines = self.peek_lines()
-            m = self.partial_typed_arg_start_re.match(lines[0])
+            if (self.partial_typed_arg_start_re is
+                    BeanbagDocstring.partial_typed_arg_start_re and
+                self.partial_typed_arg_end_re is
+                    BeanbagDocstring.partial_typed_arg_end_re):
+                is_start = _is_partial_typed_arg_start
+                is_end = _is_partial_typed_arg_end
+            else:
+                # A subclass has provided its own patterns, so use those
+                # instead of the faster checks.
+                is_start = self.partial_typed_arg_start_re.match
+                is_end = self.partial_typed_arg_end_re.match
 
-            if m:
+            # Peek at all the lines we may need up-front, rather than
+            # re-peeking for each line we check below.
+            lines = self.peek_lines(self.MAX_PARTIAL_TYPED_ARG_LINES)
+            first_line = lines[0]
+
+            if is_start(first_line):
                 result = None
 
-                for i in range(1, self.MAX_PARTIAL_TYPED_ARG_LINES):
+                for i in range(1, len(lines)):
                     # See if there's an ending part anywhere.
-                    lines = self.peek_lines(i + 1)
+                    line = lines[i]
 
-                    if not isinstance(lines[i], str):
+                    if not isinstance(line, str):
                         # We're past the strings and into something else.
                         # Bail.
                         break
 
-                    m = self.partial_typed_arg_start_re.match(lines[i])
-
-                    if m:
+                    if is_start(line):
                         # We're in a new typed arg. Bail.
                         break
 
-                    m = self.partial_typed_arg_end_re.match(lines[i])
-
-                    if m:
-                        # We need to rebuild the string based on the lines
-                        # we've determined for the field. We have to be
-                        # careful to join them in such a way where we have
-                        # a space in-between if separating words, but not if
-                        # separating parts of a class name.
-                        parts = []
-                        prev_line = None
-
-                        for line in lines:
-                            norm_line = line.strip()
-
-                            if norm_line and prev_line is not None:
-                                if (norm_line.startswith('.') or
-                                    prev_line.endswith('.')):
-                                    line = norm_line
-                                else:
-                                    parts.append(' ')
-
-                            parts.append(line)
-                            prev_line = norm_line
-
-                        result = ''.join(parts)
+                    if is_end(line):
+                        # We found the end of the typed arg.
+                        lines = lines[:i + 1]
+                        result = _join_typed_arg_lines(lines)
 
                         if ',' in result:
-                            result = ', '.join(self.COMMA_RE.split(result))
+                            result = self.COMMA_RE.sub(', ', result)
 
                         break
 
                 if result:
-                    # Consume those lines so they're not processed again.
-                    self.consume_lines(len(lines))
-
-                    # Insert the new resulting line in the line cache for
-                    # processing.
-                    self.queue_line(result)
+                    # Consume all but the last of those lines so they're not
+                    # processed again, and replace the last one with the
+                    # resulting line for processing.
+                    self.consume_lines(len(lines) - 1)
+                    self._replace_next_line(result)
 
         name, type_str, desc = super(BeanbagDocstring, self)._consume_field(
             parse_type, *args, **kwargs)
@@ -464,71 +765,138 @@ class BeanbagDocstring(GoogleDocstring):
             for name, type_str, desc in nodes
         ]
 
-    def peek_lines(self, num_lines=1):
-        """Return the specified number of lines without consuming them.
+    # The line storage differs between versions of Sphinx, so the line
+    # access methods are picked once here, rather than checking the
+    # version on every call.
+    if _USES_LINES_DEQUE:
+        # Sphinx >= 5.1
+        def peek_lines(self, num_lines=1):
+            """Return the specified number of lines without consuming them.
+
+            Version Added:
+                1.9
+
+            Args:
+                num_lines (int, optional):
+                    The number of lines to return.
+
+            Returns:
+                list of str:
+                The resulting lines.
+            """
+            lines = self._lines
 
-        Version Added:
-            1.9
+            if num_lines == 1:
+                return [lines[0] if lines else lines.sentinel]
 
-        Args:
-            num_lines (int, optional):
-                The number of lines to return.
+            result = list(islice(lines, num_lines))
+            missing = num_lines - len(result)
 
-        Returns:
-            list of str:
-            The resulting lines.
-        """
-        if self._USES_LINES_DEQUE:
-            # Sphinx >= 5.1
-            lines = self._lines
+            if missing > 0:
+                # Pad with the sentinel, as Deque.get() would.
+                result += [lines.sentinel] * missing
 
-            return [
-                lines.get(i)
-                for i in range(num_lines)
-            ]
-        else:
-            # Sphinx < 5.1
-            return self._line_iter.peek(num_lines)
+            return result
 
-    def consume_lines(self, num_lines):
-        """Consume the specified number of lines.
+        def consume_lines(self, num_lines):
+            """Consume the specified number of lines.
 
-        This will ensure that these lines are not processed any further.
+            This will ensure that these lines are not processed any further.
 
-        Version Added:
-            1.9
+            Version Added:
+                1.9
+
+            Args:
+                num_lines (int, optional):
+                    The number of lines to consume.
+            """
+            popleft = self._lines.popleft
 
-        Args:
-            num_lines (int, optional):
-                The number of lines to consume.
-        """
-        if self._USES_LINES_DEQUE:
-            # Sphinx >= 5.1
             for i in range(num_lines):
-                self._lines.popleft()
-        else:
-            # Sphinx < 5.1
-            self._line_iter.next(num_lines)
+                popleft()
 
-    def queue_line(self, line):
-        """Queue a line for processing.
+        def queue_line(self, line):
+            """Queue a line for processing.
 
-        This will place the line at the beginning of the processing queue.
+            This will place the line at the beginning of the processing queue.
 
-        Version Added:
-            1.9
+            Version Added:
+                1.9
 
-        Args:
-            line (str):
-                The line to queue.
-        """
-        if self._USES_LINES_DEQUE:
-            # Sphinx >= 5.1
+            Args:
+                line (str):
+                    The line to queue.
+            """
             self._lines.appendleft(line)
-        else:
-            # Sphinx < 5.1
+
+        def _replace_next_line(self, line):
+            """Replace the next line to be processed.
+
+            There must be at least one line left to process.
+
+            Args:
+                line (str):
+                    The new line.
+            """
+            self._lines[0] = line
+    else:
+        # Sphinx < 5.1
+        def peek_lines(self, num_lines=1):
+            """Return the specified number of lines without consuming them.
+
+            Version Added:
+                1.9
+
+            Args:
+                num_lines (int, optional):
+                    The number of lines to return.
+
+            Returns:
+                list of str:
+                The resulting lines.
+            """
+            return self._line_iter.peek(num_lines)
+
+        def consume_lines(self, num_lines):
+            """Consume the specified number of lines.
+
+            This will ensure that these lines are not processed any further.
+
+            Version Added:
+                1.9
+
+            Args:
+                num_lines (int, optional):
+                    The number of lines to consume.
+            """
+            self._line_iter.next(num_lines)
+
+        def queue_line(self, line):
+            """Queue a line for processing.
+
+            This will place the line at the beginning of the processing queue.
+
+            Version Added:
+                1.9
+
+            Args:
+                line (str):
+                    The line to queue.
+            """
             self._line_iter._cache.appendleft(line)
 
+        def _replace_next_line(self, line):
+            """Replace the next line to be processed.
+
+            There must be at least one line left to process, and it must
+            have already been peeked at.
+
+            Args:
+                line (str):
+                    The new line.
+            """
+            self._line_iter._cache[0] = line
+
     def make_type_reference(self, type_str):
         """Create references to types in a type string.
 
@@ -553,29 +921,99 @@ class BeanbagDocstring(GoogleDocstring):
             unicode:
             The new string.
         """
-        if not type_str:
+        if not type_str or ':class:' in type_str or ':obj:' in type_str:
+            # There's either nothing to convert, or this has already been
+            # converted to references.
             return type_str
 
+        # Results depend only on the type string and the configured type
+        # aliases, so they're cached for each configuration and shared
+        # across all docstrings. The cache for the configuration is looked
+        # up the first time it's needed for this docstring.
+        type_references = self._type_references
+
+        if type_references is None:
+            config = self._config
+
+            try:
+                type_references = _type_references_cache[config]
+            except KeyError:
+                type_references = {}
+                _type_references_cache[config] = type_references
+
+            self._type_references = type_references
+
+        try:
+            return type_references[type_str]
+        except KeyError:
+            pass
+
         type_aliases = \
             getattr(self._config, 'napoleon_type_aliases', None) or {}
-        parts = type_str.split(',')
-        type_parts = []
+        type_spec, has_suffixes, suffixes = type_str.partition(',')
+
+        if ' ' not in type_spec:
+            # This is a single type, which is the most common case.
+            if type_spec in _TYPE_CONNECTOR_WORDS:
+                result = type_spec
+            elif type_spec in type_aliases:
+                result = type_aliases[type_spec]
+            else:
+                result = _convert_unaliased_type_spec(type_spec)
+        else:
+            result = ' '.join(
+                type_part
+                if type_part in _TYPE_CONNECTOR_WORDS
+                else (type_aliases[type_part]
+                      if type_part in type_aliases
+                      else _convert_unaliased_type_spec(type_part))
+                for type_part in type_spec.split(' ')
+            )
 
-        for type_part in parts[0].split(' '):
-            if type_part not in ('of', 'or'):
-                type_part = _convert_type_spec(type_part, type_aliases)
+        if has_suffixes:
+            result = '%s,%s' % (
+                result,
+                ','.join(
+                    ' *%s*' % suffix.strip()
+                    for suffix in suffixes.split(',')
+                ))
 
-            type_parts.append(type_part)
+        type_references[type_str] = result
 
-        new_parts = [' '.join(type_parts)]
+        return result
 
-        if len(parts) > 1:
-            new_parts += [
-                r' *%s*' % _part.strip()
-                for _part in parts[1:]
-            ]
 
-        return ','.join(new_parts)
+def _get_module_excludes(module_name):
+    """Return the names excluded or deprecated by a module.
+
+    The module's ``__autodoc_excludes__`` and ``__deprecated__`` lists are
+    combined into a set the first time the module is seen, and cached for
+    subsequent lookups. The cache is invalidated if the module is replaced
+    in :py:data:`sys.modules` (for instance, if it's reloaded).
+
+    Args:
+        module_name (unicode):
+            The name of the module.
+
+    Returns:
+        frozenset:
+        The names listed in ``__autodoc_excludes__`` or ``__deprecated__``.
+    """
+    module = sys.modules[module_name]
+
+    try:
+        cached_module, excludes = _module_excludes_cache[module_name]
+
+        if cached_module is module:
+            return excludes
+    except KeyError:
+        pass
+
+    excludes = frozenset(getattr(module, '__autodoc_excludes__', [])).union(
+        getattr(module, '__deprecated__', []))
+    _module_excludes_cache[module_name] = (module, excludes)
+
+    return excludes
 
 
 def _filter_members(app, what, name, obj, skip, options):
@@ -613,28 +1051,52 @@ def _filter_members(app, what, name, obj, skip, options):
         bool:
         Whether the member will be skipped.
     """
-    module_name = app.env.temp_data.get('autodoc:module')
+    temp_data = app.env.temp_data
+    module_name = temp_data.get('autodoc:module')
 
     if not module_name:
         return
 
-    module = sys.modules[module_name]
-
-    # Check if the module itself is excluding this from the docs.
-    module_excludes = getattr(module, '__autodoc_excludes__', [])
+    if skip:
+        # Autodoc is already skipping this, so there's nothing to check.
+        return skip
 
-    if name in module_excludes:
-        return True
+    # Check if this appears in the global list of excludes, or if the module
+    # itself is excluding this from the docs or has listed it as deprecated.
+    #
+    # Autodoc processes all the members of a module in a row, so we keep
+    # the current module's combined excludes for each type of object in the
+    # document's temporary data. That way, each member only needs a single
+    # lookup.
+    cached = temp_data.get('beanbag_docutils:autodoc_module_excludes')
+
+    if cached is None or cached[0] != module_name:
+        cached = (module_name, {})
+        temp_data['beanbag_docutils:autodoc_module_excludes'] = cached
+
+    module_excludes_by_what = cached[1]
+
+    try:
+        excludes = module_excludes_by_what[what]
+    except KeyError:
+        # The wildcard and type-specific global excludes are combined the
+        # first time each type of object is seen in the build.
+        config = app.config
+        excludes_by_what = config._autodoc_excludes_by_what
 
-    # Check if this appears in the global list of excludes.
-    global_excludes = app.config['autodoc_excludes']
+        try:
+            global_excludes = excludes_by_what[what]
+        except KeyError:
+            autodoc_excludes = config.autodoc_excludes
+            global_excludes = \
+                autodoc_excludes.get('*', _EMPTY_EXCLUDES).union(
+                    autodoc_excludes.get(what, _EMPTY_EXCLUDES))
+            excludes_by_what[what] = global_excludes
 
-    for key in (what, '*'):
-        if key in global_excludes and name in global_excludes.get(key, []):
-            return True
+        excludes = global_excludes.union(_get_module_excludes(module_name))
+        module_excludes_by_what[what] = excludes
 
-    # Check if this appears in the list of deprecated objects.
-    if name in getattr(module, '__deprecated__', []):
+    if name in excludes:
         return True
 
     return skip
@@ -665,10 +1127,23 @@ def _process_docstring(app, what, name, obj, options, lines):
         lines (list of unicode):
             The lines to process.
     """
-    if app.config['napoleon_beanbag_docstring']:
-        docstring = BeanbagDocstring(lines, app.config, app, what, name, obj,
-                                     options)
-        lines[:] = docstring.lines()[:]
+    config = app.config
+
+    if not lines or not config._use_beanbag_docstring:
+        return
+
+    if (what not in _INLINE_TYPE_WHATS and
+        not any(':' in line for line in lines)):
+        # Every section and field requires a colon, so there's nothing for
+        # the parser to do. Skip it, since most docstrings are simple
+        # descriptions. We still strip trailing whitespace, as the parser
+        # would have.
+        lines[:] = [line.rstrip() for line in lines]
+        return
+
+    docstring = BeanbagDocstring(lines, config, app, what, name, obj,
+                                 options)
+    lines[:] = docstring.lines()
 
 
 def _on_config_inited(app, config):
@@ -702,12 +1177,13 @@ def _on_config_inited(app, config):
         config.values['autoclass_content'] = \
             ('class',) + config.values['autoclass_content'][1:]
 
-        config.autodoc_default_options = dict({
+        config.autodoc_default_options = {
             'members': True,
             'special-members': True,
             'undoc-members': True,
             'show-inheritance': True,
-        }, **(config.autodoc_default_options or {}))
+            **(config.autodoc_default_options or {}),
+        }
 
     # Register type aliases.
     new_type_aliases = {}
@@ -744,34 +1220,38 @@ def _on_config_inited(app, config):
 
     # Update autodoc_excludes to include defaults if requested.
     #
-    # We'll also ensure all lists are sets, to make processing faster.
-    if config.autodoc_excludes.get('__defaults__'):
-        new_autodoc_excludes = {
-            '*': {
-                '__annotations__',
-                '__dict__',
-                '__doc__',
-                '__module__',
-                '__weakref__',
-            },
-        }
+    # We'll also ensure all lists are frozensets, so that lookups in
+    # _filter_members() are constant-time.
+    autodoc_excludes = config.autodoc_excludes
+    use_defaults = autodoc_excludes.get('__defaults__')
+    new_autodoc_excludes = {}
+
+    if use_defaults:
+        new_autodoc_excludes['*'] = _DEFAULT_WILDCARD_EXCLUDES
+
+    for key, value in autodoc_excludes.items():
+        if key == '__defaults__':
+            continue
+        elif key == '*' and use_defaults:
+            new_autodoc_excludes[key] = \
+                _DEFAULT_WILDCARD_EXCLUDES.union(value)
+        else:
+            new_autodoc_excludes[key] = frozenset(value)
 
-        if '*' in config.autodoc_excludes:
-            new_autodoc_excludes['*'].update(config.autodoc_excludes['*'])
+    config.autodoc_excludes = new_autodoc_excludes
 
-        new_autodoc_excludes.update({
-            key: set(value)
-            for key, value in config.autodoc_excludes.items()
-            if key not in ('*', '__defaults__')
-        })
-    else:
-        new_autodoc_excludes = {
-            key: set(value)
-            for key, value in config.autodoc_excludes.items()
-            if key != '__defaults__'
-        }
+    # This will be populated by _filter_members() with the combined
+    # wildcard and type-specific excludes for each type of object.
+    config._autodoc_excludes_by_what = {}
 
-    config.autodoc_excludes = new_autodoc_excludes
+    # _process_docstring() checks this for every docstring. Store the final
+    # value directly on the instance, so those checks don't need to go
+    # through the Config's lookup and default value logic.
+    config._use_beanbag_docstring = config.napoleon_beanbag_docstring
+
+    # Start each build with fresh module excludes, in case modules have
+    # changed since a previous build in this process.
+    _module_excludes_cache.clear()
 
 
 def setup(app):
@@ -33,8 +33,9 @@ Configuration
 """
 
 import os
+import re
 import shutil
-from fnmatch import fnmatch
+from fnmatch import translate
 
 
 def collect_files(app, env):
@@ -48,9 +49,20 @@ def collect_files(app, env):
             The build environment for the generated docs.
     """
     collect_patterns = app.config['collect_file_patterns']
+
+    if not collect_patterns:
+        return
+
     src_dir = app.builder.srcdir
     out_dir = app.builder.outdir
 
+    # Combine all the patterns into a single regex, so each filename only
+    # needs to be matched once.
+    match_filename = re.compile('|'.join(
+        '(?:%s)' % translate(os.path.normcase(pattern))
+        for pattern in collect_patterns
+    )).match
+
     for root, dirs, files in os.walk(src_dir):
         # Make sure we don't recurse into the build directory.
         if root == src_dir:
@@ -59,14 +71,41 @@ def collect_files(app, env):
             except ValueError:
                 pass
 
+        dest_dir = None
+
         for filename in files:
-            for pattern in collect_patterns:
-                if fnmatch(filename, pattern):
-                    shutil.copy(os.path.join(root, filename),
-                                os.path.join(out_dir,
-                                             os.path.relpath(root, src_dir),
-                                             filename))
-                    break
+            if match_filename(os.path.normcase(filename)):
+                if dest_dir is None:
+                    dest_dir = os.path.join(out_dir,
+                                            os.path.relpath(root, src_dir))
+
+                    # Sphinx only creates output directories for documents,
+                    # so make sure one exists for files in any other
+                    # directory.
+                    os.makedirs(dest_dir, exist_ok=True)
+
+                src_path = os.path.join(root, filename)
+                dest_path = os.path.join(dest_dir, filename)
+
+                # Skip the copy if the destination is already up-to-date
+                # from a previous build.
+                try:
+                    src_stat = os.stat(src_path)
+                    dest_stat = os.stat(dest_path)
+
+                    if (dest_stat.st_size == src_stat.st_size and
+                        dest_stat.st_mtime >= src_stat.st_mtime):
+                        continue
+                except OSError:
+                    pass
+
+                # Most files only need their contents copied, so this avoids
+                # the extra work of shutil.copy(). We still want executable
+                # files (such as scripts) to stay executable, though.
+                shutil.copyfile(src_path, dest_path)
+
+                if os.access(src_path, os.X_OK):
+                    shutil.copymode(src_path, dest_path)
 
 
 def setup(app):
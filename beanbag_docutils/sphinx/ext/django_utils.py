@@ -44,13 +44,25 @@ Roles
 from django.utils.functional import Promise
 
 
+#: A mapping of Promise classes to whether they're lazy strings.
+_lazy_str_classes = {}
+
+
 def _repr_promise(promise):
     """Return a sane representation of a lazy localized string.
 
     If the promise is a result of ugettext_lazy(), it will be converted into
     a Unicode string before generating a representation.
     """
-    if hasattr(promise, '_proxy____text_cast'):
+    promise_cls = type(promise)
+
+    try:
+        is_lazy_str = _lazy_str_classes[promise_cls]
+    except KeyError:
+        is_lazy_str = hasattr(promise_cls, '_proxy____text_cast')
+        _lazy_str_classes[promise_cls] = is_lazy_str
+
+    if is_lazy_str:
         return '_(%r)' % str(promise)
 
     return super(promise.__class__, promise).__repr__(promise)
@@ -68,6 +80,6 @@ def setup(app):
     """
     Promise.__repr__ = _repr_promise
 
-    app.add_crossref_type(directivename=str('setting'),
-                          rolename=str('setting'),
-                          indextemplate=str('pair: %s; setting'))
+    app.add_crossref_type(directivename='setting',
+                          rolename='setting',
+                          indextemplate='pair: %s; setting')
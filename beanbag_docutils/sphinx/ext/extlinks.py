@@ -44,6 +44,7 @@ class ExternalLink(object):
                 The URL to wrap. This must contain a ``%s``.
         """
         self.base_url = base_url
+        self._urls = {}
 
     def __mod__(self, ref):
         """Return a URL based on the stored string format and the reference.
@@ -57,11 +58,16 @@ class ExternalLink(object):
             unicode:
             The formatted URL.
         """
-        parts = ref.split('#', 1)
-        url = self.base_url % parts[0]
-
-        if len(parts) == 2:
-            url = '%s#%s' % (url, parts[1])
+        # The same references are often linked many times across a set of
+        # docs, so cache the resulting URLs.
+        try:
+            return self._urls[ref]
+        except KeyError:
+            pass
+
+        path, anchor_sep, anchor = ref.partition('#')
+        url = '%s%s%s' % (self.base_url % path, anchor_sep, anchor)
+        self._urls[ref] = url
 
         return url
 
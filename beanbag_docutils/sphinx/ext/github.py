@@ -31,28 +31,37 @@ To use this, you'll need to import the module and define your own
 
 ``source_prefix`` and ``allowed_module_names`` are optional. See the
 docs for :py:func:`github_linkcode_resolve` for more information.
+
+The merge base branch will be fetched from ``origin`` before looking up the
+commit to link to. If you know your checkout is already up-to-date, you can
+skip this by setting the ``BEANBAG_DOCUTILS_SKIP_FETCH`` environment
+variable.
 """
 
 import ast
 import inspect
 import logging
+import os
 import re
 import subprocess
 import sys
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
 
 GIT_BRANCH_CONTAINS_RE = re.compile(r'^\s*([^\s]+)\s+([0-9a-f]+)\s.*')
 
-# We'll store 5 items in the AST cache by default. This will ensure that we
-# don't re-parse the same tree any more often than we have to, and leave
-# room for some parallel processing if needed.
-_AST_CACHE_MAX_SIZE = 5
+# We'll store 32 items in the AST cache by default. This will ensure that we
+# don't re-parse the same tree any more often than we have to, even when a
+# page documents or references objects from many modules, and leave room for
+# some parallel processing if needed.
+_AST_CACHE_MAX_SIZE = 32
 
 
-_head_ref = None
-_ast_cache = []
+_head_refs = {}
+_ast_cache = OrderedDict()
+_url_prefixes = {}
 
 
 def _run_git(cmd):
@@ -73,12 +82,9 @@ def _run_git(cmd):
     assert cmd
     assert all(cmd)
 
-    p = subprocess.Popen(['git'] + cmd, stdout=subprocess.PIPE)
-    output, error = p.communicate()
-    ret_code = p.poll()
-
-    if ret_code:
-        raise subprocess.CalledProcessError(ret_code, 'git')
+    output = subprocess.run(['git'] + cmd,
+                            stdout=subprocess.PIPE,
+                            check=True).stdout
 
     assert isinstance(output, bytes)
 
@@ -99,11 +105,13 @@ def _git_get_nearest_tracking_branch(merge_base, remote='origin'):
         unicode:
         The nearest tracking branch, or ``None`` if not found.
     """
-    try:
-        _run_git(['fetch', 'origin', '%s:%s' % (merge_base, merge_base)])
-    except Exception:
-        # Ignore, as we may already have this. Hopefully it won't fail later.
-        pass
+    if not os.environ.get('BEANBAG_DOCUTILS_SKIP_FETCH'):
+        try:
+            _run_git(['fetch', 'origin', '%s:%s' % (merge_base, merge_base)])
+        except Exception:
+            # Ignore, as we may already have this. Hopefully it won't fail
+            # later.
+            pass
 
     lines = _run_git(['branch', '-rv', '--contains', merge_base]).splitlines()
 
@@ -121,9 +129,10 @@ def _git_get_nearest_tracking_branch(merge_base, remote='origin'):
             if (ref_name.startswith(remote_prefix) and
                 not ref_name.endswith('/HEAD')):
 
-                distance = len(_run_git(['log',
-                                         '--pretty=format:%H',
-                                         '...%s' % sha]).splitlines())
+                # Let git count the commits, rather than listing them all
+                # just to count the lines.
+                distance = int(_run_git(['rev-list', '--count',
+                                         '...%s' % sha]))
 
                 if best_distance is None or distance < best_distance:
                     best_distance = distance
@@ -139,7 +148,7 @@ def _git_get_nearest_tracking_branch(merge_base, remote='origin'):
 def _get_git_doc_ref(branch):
     """Return the commit SHA used for linking to source code on GitHub.
 
-    The commit SHA will be cached for future lookups.
+    The commit SHA will be cached for future lookups of the branch.
 
     Args:
         branch (unicode):
@@ -149,23 +158,27 @@ def _get_git_doc_ref(branch):
         unicode:
         The commit SHA used for any links, if found, or ``None`` if not.
     """
-    global _head_ref
+    try:
+        return _head_refs[branch]
+    except KeyError:
+        pass
 
-    if not _head_ref:
-        _head_ref = None
+    head_ref = None
 
-        try:
-            tracking_branch = _git_get_nearest_tracking_branch(branch)
-
-            if tracking_branch:
-                _head_ref = (
-                    _run_git(['rev-parse', tracking_branch]).strip()
-                    .decode('utf-8')
-                )
-        except subprocess.CalledProcessError:
-            pass
+    try:
+        tracking_branch = _git_get_nearest_tracking_branch(branch)
+
+        if tracking_branch:
+            head_ref = (
+                _run_git(['rev-parse', tracking_branch]).strip()
+                .decode('utf-8')
+            )
+    except subprocess.CalledProcessError:
+        pass
+
+    _head_refs[branch] = head_ref
 
-    return _head_ref
+    return head_ref
 
 
 def _find_path_in_ast_nodes(nodes, path):
@@ -190,39 +203,124 @@ def _find_path_in_ast_nodes(nodes, path):
         ast.Node:
         The node, if found, or ``None`` if not found.
     """
-    name = path[0]
-
     if not isinstance(nodes, list):
         nodes = ast.iter_child_nodes(nodes)
 
+    last_i = len(path) - 1
+
+    for i, name in enumerate(path):
+        for node in nodes:
+            # If this is an explicit assignment, check to see if any of the
+            # targets of the assignment is the path we're looking for.
+            if isinstance(node, ast.Assign):
+                for target in node.targets:
+                    if getattr(target, 'id', None) == name:
+                        # We found it. We're done.
+                        #
+                        # Note that there might be more items in path, but if
+                        # so, then we're documenting something like a
+                        # namedtuple() that got code-injected. There isn't
+                        # likely to be any code to link to beyond this.
+                        return node
+
+            # If this is anything else, see if it has the next name in the
+            # path.
+            elif getattr(node, 'name', None) == name:
+                break
+        else:
+            return None
+
+        if i == last_i:
+            # This was the last part we needed. Return the node.
+            return node
+
+        # This is a match, but we have more to process. Continue on to the
+        # node's body.
+        nodes = node.body
+
+    return None
+
+
+def _parse_module_ast(module):
+    """Parse the source code for a module into an AST tree.
+
+    The source file is read and parsed directly where possible, letting
+    :py:func:`ast.parse` handle any encoding declaration. Modules without a
+    readable source file (such as those loaded from a zip file) fall back
+    on :py:func:`inspect.findsource`.
+
+    Version Added:
+        2.3.1
+
+    Args:
+        module (module):
+            The module to parse.
+
+    Returns:
+        ast.Module:
+        The parsed AST tree.
+
+    Raises:
+        Exception:
+            The source couldn't be found or parsed.
+    """
+    src_path = inspect.getsourcefile(module)
+
+    if src_path:
+        try:
+            with open(src_path, 'rb') as fp:
+                source = fp.read()
+        except OSError:
+            pass
+        else:
+            return ast.parse(source, filename=src_path)
+
+    lines = inspect.findsource(module)[0]
+
+    return ast.parse(''.join(lines))
+
+
+def _build_ast_path_index(nodes, index, prefix=()):
+    """Build an index of object paths to AST nodes.
+
+    This walks the AST tree the same way :py:func:`_find_path_in_ast_nodes`
+    does, recording the node that it would return for each path. That
+    allows each lookup to be performed without walking the tree again.
+
+    Paths that can't be found through the index, such as attributes on an
+    assigned object, must still be looked up by walking the tree.
+
+    Version Added:
+        2.3.1
+
+    Args:
+        nodes (list of ast.AST):
+            The list of nodes to index.
+
+        index (dict):
+            The index to populate. This maps tuples of identifiers to nodes.
+
+        prefix (tuple of unicode, optional):
+            The identifier path leading to these nodes.
+    """
     for node in nodes:
-        # If this is an explicit assignment, check to see if any of the
-        # targets of the assignment is the path we're looking for.
         if isinstance(node, ast.Assign):
-            target_names = {
-                getattr(_target, 'id', None)
-                for _target in node.targets
-            }
-
-            if name in target_names:
-                # We found it. We're done.
-                #
-                # Note that there might be more items in path, but if so,
-                # then we're documenting something like a namedtuple() that
-                # got code-injected. There isn't likely to be any code to
-                # link to beyond this.
-                return node
-
-        # If this is anything else, see if it has the next name in the path.
-        if hasattr(node, 'name') and node.name == name:
-            if len(path) > 1:
-                # This is a match, but we have more to process. Recurse.
-                return _find_path_in_ast_nodes(node.body, path[1:])
-            else:
-                # This was the last part we needed. Return the node.
-                return node
+            for target in node.targets:
+                target_name = getattr(target, 'id', None)
 
-    return None
+                if target_name is not None:
+                    index.setdefault(prefix + (target_name,), node)
+        else:
+            name = getattr(node, 'name', None)
+
+            if isinstance(name, str):
+                path = prefix + (name,)
+
+                # Only the first node with a name is searched when walking
+                # the tree, so only index the children of that one.
+                if path not in index:
+                    index[path] = node
+                    _build_ast_path_index(node.body, index, path)
 
 
 def _find_ast_node_for_path(module, path):
@@ -242,31 +340,33 @@ def _find_ast_node_for_path(module, path):
         ast.Node:
         The resulting node, if found, or ``None`` if not found.
     """
-    global _ast_cache
-
-    tree = None
-
-    # See if we already have a parsed AST in cache.
-    for _tree, _module in _ast_cache:
-        if _module is module:
-            tree = _tree
-            break
-
-    if tree is None:
-        # We don't have one in cache, so build it and push the last item
-        # out of cache.
+    # See if we already have a parsed AST and path index in cache.
+    try:
+        tree, index = _ast_cache[module]
+        _ast_cache.move_to_end(module)
+    except KeyError:
+        # We don't have one in cache, so build it and push the least
+        # recently-used item out of cache.
         try:
-            lines = inspect.findsource(module)[0]
-            tree = ast.parse(''.join(lines))
-            _ast_cache = (
-                [(module, tree)] +
-                _ast_cache[:_AST_CACHE_MAX_SIZE - 1]
-            )
+            tree = _parse_module_ast(module)
+
+            index = {}
+            _build_ast_path_index(tree.body, index)
         except Exception as e:
             logger.exception('Failed to parse AST tree for %r: %s',
                              module, e)
             return None
 
+        _ast_cache[module] = (tree, index)
+
+        if len(_ast_cache) > _AST_CACHE_MAX_SIZE:
+            _ast_cache.popitem(last=False)
+
+    try:
+        return index[tuple(path)]
+    except KeyError:
+        pass
+
     try:
         return _find_path_in_ast_nodes(tree, path)
     except Exception as e:
@@ -334,12 +434,16 @@ def github_linkcode_resolve(domain, info, github_org_id, github_repo_id,
     if (domain != 'py' or
         not module_name or
         (allowed_module_names and
-         module_name.split('.')[0] not in allowed_module_names)):
+         module_name.partition('.')[0] not in allowed_module_names)):
         # These aren't the modules you're looking for.
         return None
 
-    # Grab the name of the source file.
-    filename = module_name.replace('.', '/') + '.py'
+    fullname = info.get('fullname')
+
+    if not fullname:
+        # This is the module itself, which has no object to look up. Bail
+        # before we parse the module's source.
+        return None
 
     # Grab the module referenced in the docs.
     submod = sys.modules.get(module_name)
@@ -349,28 +453,43 @@ def github_linkcode_resolve(domain, info, github_org_id, github_repo_id,
 
     # Split that, trying to find the module at the very tail of the module
     # path.
-    node = _find_ast_node_for_path(submod, info['fullname'].split('.'))
+    node = _find_ast_node_for_path(submod, fullname.split('.'))
 
     if node is None:
         return None
 
+    # Grab the name of the source file.
+    filename = module_name.replace('.', '/') + '.py'
+
     # Build a reference for the line number in GitHub.
     linespec = '#L%d' % node.lineno
 
-    # Get the branch/tag/commit to link to.
-    ref = _get_git_doc_ref(branch)
+    # Everything up to the filename is the same for every link in the
+    # project, so it's only built once.
+    url_prefix_key = (github_url, github_org_id, github_repo_id, branch,
+                      source_prefix)
 
-    if not ref:
-        return None
+    try:
+        url_prefix = _url_prefixes[url_prefix_key]
+    except KeyError:
+        # Get the branch/tag/commit to link to. This is only done once we
+        # know there's something to link to, since the first lookup runs
+        # git.
+        ref = _get_git_doc_ref(branch)
+
+        if not ref:
+            return None
 
-    assert isinstance(ref, str)
+        assert isinstance(ref, str)
 
-    github_url = github_url.rstrip('/')
+        github_url = github_url.rstrip('/')
+        url_prefix = (
+            f'{github_url}/{github_org_id}/{github_repo_id}/blob/'
+            f'{ref}/{source_prefix}'
+        )
+        _url_prefixes[url_prefix_key] = url_prefix
 
-    return (
-        f'{github_url}/{github_org_id}/{github_repo_id}/blob/'
-        f'{ref}/{source_prefix}{filename}{linespec}'
-    )
+    return f'{url_prefix}{filename}{linespec}'
 
 
 def clear_github_linkcode_caches():
@@ -381,7 +500,6 @@ def clear_github_linkcode_caches():
     Version Added:
         2.0
     """
-    global _head_ref, _ast_cache
-
-    _head_ref = None
-    _ast_cache = []
+    _head_refs.clear()
+    _ast_cache.clear()
+    _url_prefixes.clear()
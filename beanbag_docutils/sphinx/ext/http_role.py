@@ -46,6 +46,8 @@ Configuration
     ``%s``, which will be replaced by the numeric HTTP status code.
 """
 
+from functools import lru_cache
+
 from docutils import nodes
 from docutils.parsers.rst import Directive
 
@@ -128,6 +130,52 @@ HTTP_STATUS_CODES = {
 }
 
 
+@lru_cache(maxsize=1024)
+def _format_status_code_url(url_format, status_code):
+    """Return the URL for documentation on an HTTP status code.
+
+    Results are cached, since the same status codes tend to be referenced
+    many times across a set of docs.
+
+    Args:
+        url_format (unicode):
+            The format string for the URL. This must contain a ``%s``.
+
+        status_code (int):
+            The HTTP status code.
+
+    Returns:
+        unicode:
+        The URL for the status code.
+    """
+    return url_format % status_code
+
+
+@lru_cache(maxsize=1024)
+def _format_status_code_text(text_format, status_code):
+    """Return the text for an HTTP status code.
+
+    Results are cached, since the same status codes tend to be referenced
+    many times across a set of docs.
+
+    Args:
+        text_format (unicode):
+            The format string for the text. This may contain ``%(code)s``
+            and ``%(name)s``.
+
+        status_code (int):
+            The HTTP status code.
+
+    Returns:
+        unicode:
+        The text for the status code.
+    """
+    return text_format % {
+        'code': status_code,
+        'name': HTTP_STATUS_CODES[status_code],
+    }
+
+
 class SetStatusCodesFormatDirective(Directive):
     """Specifies the format to use for the ``:http:`` role's text."""
 
@@ -210,7 +258,7 @@ def http_role(role, rawtext, text, linenum, inliner, options={}, content=[]):
         prb = inliner.problematic(rawtext, rawtext, msg)
         return [prb], [msg]
 
-    ref = http_status_codes_url % status_code
+    ref = _format_status_code_url(http_status_codes_url, status_code)
 
     if has_explicit_title:
         status_code_text = title
@@ -219,10 +267,8 @@ def http_role(role, rawtext, text, linenum, inliner, options={}, content=[]):
             env.temp_data.get('http-status-codes-format') or
             env.config.http_status_codes_format
         )
-        status_code_text = http_status_codes_format % {
-            'code': status_code,
-            'name': HTTP_STATUS_CODES[status_code],
-        }
+        status_code_text = _format_status_code_text(
+            http_status_codes_format, status_code)
 
     node = nodes.reference(rawtext, status_code_text, refuri=ref, **options)
 
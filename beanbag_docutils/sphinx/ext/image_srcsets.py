@@ -42,14 +42,12 @@ To use this, you just need to add the extension in :file:`conf.py`::
 import os
 import posixpath
 import re
-from collections import OrderedDict
-from glob import glob
 from typing import Dict, List, Optional, TYPE_CHECKING
+from urllib.parse import quote as urllib_quote
 
 from docutils import nodes
 from docutils.parsers.rst import directives
 from docutils.parsers.rst.directives.images import Image
-from six.moves.urllib.parse import quote as urllib_quote
 from sphinx.application import Sphinx
 from sphinx.util.i18n import search_image_for_language
 
@@ -62,6 +60,16 @@ if TYPE_CHECKING:
 WIDTH_ATTR_RE = re.compile(r' width="(\d+)"')
 HEIGHT_ATTR_RE = re.compile(r' height="(\d+)"')
 STYLE_ATTR_RE = re.compile(r' style="(?P<style>[^"]+)"')
+SRCSET_SPLIT_RE = re.compile(r',|\n+')
+SRCSET_DESCRIPTOR_RE = re.compile(r'@(\d+[xwh])')
+
+
+if hasattr(nodes.Node, 'findall'):
+    # This is the modern way of finding nodes.
+    _findall = nodes.Node.findall
+else:
+    # This is pending deprecation in docutils.
+    _findall = nodes.Node.traverse
 
 
 def _get_srcsets(
@@ -98,16 +106,21 @@ def _get_srcsets(
         assert docname
 
         srcset = node.attributes.get('sources')
-        norm_srcsets = OrderedDict()
+        norm_srcsets = {}
 
         if srcset:
             norm_srcsets['1x'] = node.attributes['uri']
 
-            for source in re.split(r',|\n+', srcset):
+            for source in SRCSET_SPLIT_RE.split(srcset):
                 source = source.strip()
 
                 if source:
-                    descriptor, url = source.split(' ', 1)
+                    descriptor, sep, url = source.partition(' ')
+
+                    if not sep:
+                        # This is missing a descriptor or URL. Skip it.
+                        continue
+
                     norm_srcsets[descriptor.strip()] = env.relfn2path(
                         search_image_for_language(url.strip(), env),
                         docname)[0]
@@ -145,14 +158,16 @@ def _visit_image_html(
         last_tag = self.body[-1]
         assert last_tag.startswith('<img ')
 
+        # str.join() would build a list from a generator anyway, so build
+        # the list directly.
+        srcset_parts: List[str] = [
+            '%s %s' % (posixpath.join(base_images_path,
+                                      urllib_quote(images[url][1])),
+                       source)
+            for source, url in srcsets.items()
+        ]
         new_attrs: List[str] = [
-            'srcset="%s"' % ', '.join(
-                '%s %s' % (
-                    posixpath.join(base_images_path,
-                                   urllib_quote(images[url][1])),
-                    source)
-                for source, url in srcsets.items()
-            ),
+            'srcset="%s"' % ', '.join(srcset_parts),
         ]
 
         # Set a width attribute.
@@ -214,17 +229,15 @@ def collect_srcsets(
             The document tree being processed.
     """
     env = app.env
-    images = env.images
     docname = env.docname
+    add_image_file = env.images.add_file
+    image_paths = set()
 
-    if hasattr(doctree, 'findall'):
-        # This is the modern way of finding nodes.
-        findall = doctree.findall
-    else:
-        # This is pending deprecation in docutils.
-        findall = doctree.traverse
+    # Documents often contain several images from the same directory, so
+    # list each directory only once.
+    dir_filenames = {}
 
-    for node in findall(nodes.image):
+    for node in _findall(doctree, nodes.image):
         srcsets = _get_srcsets(node=node,
                                env=env,
                                docname=docname)
@@ -234,27 +247,51 @@ def collect_srcsets(
             uri = node['uri']
             image_path = search_image_for_language(uri, env)
             base_filename, ext = os.path.splitext(image_path)
-            candidates = glob('%s@*%s' % (base_filename, ext))
+            dirname, basename = os.path.split(base_filename)
+
+            try:
+                filenames = dir_filenames[dirname]
+            except KeyError:
+                try:
+                    filenames = sorted(os.listdir(dirname or os.curdir))
+                except OSError:
+                    filenames = []
+
+                dir_filenames[dirname] = filenames
+
+            # Look for files in the form of <basename>@<descriptor><ext>.
+            prefix = '%s@' % basename
+            min_len = len(prefix) + len(ext)
+            candidates = [
+                filename
+                for filename in filenames
+                if (filename.startswith(prefix) and
+                    filename.endswith(ext) and
+                    len(filename) >= min_len)
+            ]
 
             if candidates:
                 srcsets['1x'] = uri
+                basename_len = len(basename)
 
-                pattern = re.compile(r'%s@(\d+[xwh])%s'
-                                     % (re.escape(base_filename),
-                                        re.escape(ext)))
-
-                for candidate in sorted(candidates):
-                    m = pattern.match(candidate)
+                for candidate in candidates:
+                    # Match only the descriptor following the base filename,
+                    # rather than compiling a pattern for each image.
+                    m = SRCSET_DESCRIPTOR_RE.match(candidate, basename_len)
 
-                    if m:
+                    if m and candidate.startswith(ext, m.end()):
                         descriptor = m.group(1)
 
                         if descriptor not in srcsets:
-                            srcsets[descriptor] = candidate
+                            srcsets[descriptor] = \
+                                os.path.join(dirname, candidate)
 
-        for descriptor, image_path in srcsets.items():
-            env.dependencies[docname].add(image_path)
-            images.add_file(docname, image_path)
+        for image_path in srcsets.values():
+            image_paths.add(image_path)
+            add_image_file(docname, image_path)
+
+    if image_paths:
+        env.dependencies[docname].update(image_paths)
 
 
 def collect_pages(
@@ -274,10 +311,10 @@ def collect_pages(
         list:
         An empty list (indicating no additional HTML pages are collected).
     """
-    app.builder.images.update({
-        full_path: filename
-        for full_path, (docnames, filename) in app.env.images.items()
-    })
+    builder_images = app.builder.images
+
+    for full_path, (docnames, filename) in app.env.images.items():
+        builder_images[full_path] = filename
 
     return []
 
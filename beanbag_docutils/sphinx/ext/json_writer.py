@@ -70,7 +70,7 @@ pre-rendered HTML, following the form of the normal ``toc`` key. For example:
 
 """
 
-from typing import Any, Dict, List, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 from sphinx.environment.adapters.toctree import TocTree
 
@@ -114,34 +114,52 @@ class JSONBuilder(JSONHTMLBuilder):
 
     def _build_toc(
         self,
-        docnames,  # type: List[str]
+        docnames,    # type: List[str]
+        _memo=None,  # type: Optional[Dict[str, Dict[str, Any]]]
     ):  # type: (...) -> List[Dict[str, Any]]
         """Build the Table of Contents for a given level
 
         This will iterate through ``docnames`` and produce entries for each,
         recursively building for any child documents.
 
+        Entries are built only once per document, so documents included
+        from several toctrees share the same entry.
+
         Args:
             docnames (list of str):
                 The list of document names on this level.
 
+            _memo (dict, optional):
+                The entries already built for documents. This is used
+                internally when recursing.
+
         Returns:
             list of dict:
             The list of Table of Contents entries for this level.
         """
+        if _memo is None:
+            _memo = {}
+
         env = self.env
+        titles = env.titles
+        toctree_includes = env.toctree_includes
         toc = []  # type: List[Dict[str, Any]]
 
         for docname in docnames:
-            toc_info = {
-                'docname': docname,
-                'title': str(env.titles[docname].children[0]),
-            }  # type: Dict[str, Any]
+            try:
+                toc_info = _memo[docname]
+            except KeyError:
+                toc_info = {
+                    'docname': docname,
+                    'title': str(titles[docname].children[0]),
+                }  # type: Dict[str, Any]
+
+                children = toctree_includes.get(docname, [])
 
-            children = env.toctree_includes.get(docname, [])
+                if children:
+                    toc_info['items'] = self._build_toc(children, _memo)
 
-            if children:
-                toc_info['items'] = self._build_toc(children)
+                _memo[docname] = toc_info
 
             toc.append(toc_info)
 
@@ -33,7 +33,6 @@ To use this, you just need to add the extension in :file:`conf.py`::
 
 from typing import Any, Dict, TYPE_CHECKING
 
-import six
 from docutils import nodes, __version__ as DOCUTILS_VERSION
 from sphinx.errors import ExtensionError
 
@@ -43,6 +42,14 @@ if TYPE_CHECKING:
     from sphinx.application import Sphinx
 
 
+if hasattr(nodes.Node, 'findall'):
+    # This is the modern way of finding nodes.
+    _findall = nodes.Node.findall
+else:
+    # This is pending deprecation in docutils.
+    _findall = nodes.Node.traverse
+
+
 def _on_doctree_read(
     app,     # type: Sphinx
     doctree  # type: nodes.document
@@ -65,15 +72,7 @@ def _on_doctree_read(
     metadata = {}  # type: Dict[str, Any]
     env = app.env
 
-    if hasattr(doctree, 'findall'):
-        # This is the modern way of finding nodes.
-        findall = doctree.findall
-    else:
-        # This is pending deprecation in docutils.
-        findall = doctree.traverse
-        assert False
-
-    for node in findall(nodes.meta):
+    for node in _findall(doctree, nodes.meta):
         if not node.hasattr('name'):
             continue
 
@@ -87,7 +86,7 @@ def _on_doctree_read(
     docname = env.docname
     doc_metadata = env.metadata[docname]
 
-    for key, values in six.iteritems(metadata):
+    for key, values in metadata.items():
         if len(values) == 1:
             doc_metadata[key] = values[0]
         else:
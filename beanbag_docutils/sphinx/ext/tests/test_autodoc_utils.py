@@ -1,5 +1,7 @@
 """Unit tests for beanbag_docutils.sphinx.ext.autodoc_utils."""
 
+import re
+
 from sphinx import version_info as sphinx_version_info
 
 from beanbag_docutils.sphinx.ext import autodoc_utils
@@ -280,6 +282,19 @@ class BeanbagDocstringTests(SphinxExtTestCase):
                 ':param \\*\\*kwargs: Description of kwargs.\n'
                 ':type \\*\\*kwargs: :class:`dict`\n')
 
+    def test_args_section_with_type_references(self):
+        """Testing Beanbag docstring with Args section with types that are
+        already references
+        """
+        self.assertEqual(
+            self._render_docstring(
+                'Args:\n'
+                '   arg1 (:py:class:`str`):\n'
+                '       Description of arg1.\n'
+            ),
+            ':param arg1: Description of arg1.\n'
+            ':type arg1: :py:class:`str`\n')
+
     def test_context_section_with_description(self):
         """Testing Beanbag docstring with Context section with description"""
         self.assertEqual(
@@ -607,19 +622,91 @@ class BeanbagDocstringTests(SphinxExtTestCase):
             )
         )
 
-    def _render_docstring(self, content):
+    def test_subclass_with_custom_registration(self):
+        """Testing Beanbag docstring subclass overriding section registration
+        """
+        class CustomDocstring(BeanbagDocstring):
+            def register_returns_section(self, keyword, label, options={}):
+                super(CustomDocstring, self).register_returns_section(
+                    keyword, label.upper(), options)
+
+        content = (
+            'Context:\n'
+            '    Description of the context.\n'
+        )
+
+        self.assertEqual(
+            self._render_docstring(content, docstring_cls=CustomDocstring),
+            ':CONTEXT: Description of the context.\n')
+
+        # The parent class shouldn't be affected.
+        self.assertEqual(
+            self._render_docstring(content),
+            ':Context: Description of the context.\n')
+
+    def test_subclass_with_custom_partial_typed_arg_re(self):
+        """Testing Beanbag docstring subclass overriding
+        partial_typed_arg_end_re
+        """
+        class CustomDocstring(BeanbagDocstring):
+            partial_typed_arg_end_re = re.compile(r'\s*(.+?)\s*\)\s*:$')
+
+        content = (
+            'Args:\n'
+            '    arg1 (foo.bar.\n'
+            '          Baz) :\n'
+            '        Description.\n'
+        )
+
+        self.assertEqual(
+            self._render_docstring(content, docstring_cls=CustomDocstring),
+            ':param arg1: Description.\n'
+            ':type arg1: :py:class:`foo.bar.Baz`\n')
+
+        # The parent class shouldn't be affected.
+        self.assertEqual(
+            self._render_docstring(content),
+            ':param arg1 (foo.bar.:   Baz) :\n'
+            '                       Description.\n')
+
+    def test_process_docstring_without_sections(self):
+        """Testing Beanbag docstring processing without sections strips
+        trailing whitespace
+        """
+        lines = [
+            'This is a description.  ',
+            '\t',
+            'More description.',
+        ]
+
+        with self.with_sphinx_env() as ctx:
+            autodoc_utils._process_docstring(ctx['app'], 'function',
+                                             'my_function', None, {}, lines)
+
+        self.assertEqual(
+            lines,
+            [
+                'This is a description.',
+                '',
+                'More description.',
+            ])
+
+    def _render_docstring(self, content, docstring_cls=BeanbagDocstring):
         """Render a Beanbag docstring to ReST.
 
         Args:
             content (unicode):
                 The docstring content to render.
 
+            docstring_cls (type, optional):
+                The docstring class to render with.
+
         Returns:
             unicode:
             The resulting ReStructuredText.
         """
         with self.with_sphinx_env() as ctx:
-            return str(BeanbagDocstring(content, config=ctx['config']))
+            return str(docstring_cls(content, config=ctx['config']))
 
 
 __autodoc_excludes__ = ['IgnoredModule']
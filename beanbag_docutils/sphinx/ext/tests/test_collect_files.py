@@ -0,0 +1,150 @@
+"""Unit tests for beanbag_docutils.sphinx.ext.collect_files."""
+
+import os
+import shutil
+
+import kgb
+
+from beanbag_docutils.sphinx.ext import collect_files
+from beanbag_docutils.sphinx.ext.tests.testcase import SphinxExtTestCase
+
+
+class CollectFilesTests(kgb.SpyAgency, SphinxExtTestCase):
+    """Unit tests for collect_files."""
+
+    extensions = [
+        collect_files.__name__,
+    ]
+
+    config = {
+        'collect_file_patterns': ['*.txt'],
+    }
+
+    def test_collect_files(self):
+        """Testing collect_files copies matching files"""
+        with self.with_sphinx_env() as ctx:
+            app = ctx['app']
+            srcdir = str(ctx['srcdir'])
+
+            self._write_file(os.path.join(srcdir, 'contents.rst'), '')
+            self._write_file(os.path.join(srcdir, 'notes.txt'), 'Notes')
+            self._write_file(os.path.join(srcdir, 'image.png'), 'PNG')
+
+            app.build()
+
+            outdir = str(app.outdir)
+
+            self.assertEqual(self._read_file(os.path.join(outdir,
+                                                          'notes.txt')),
+                             'Notes')
+            self.assertFalse(os.path.exists(os.path.join(outdir,
+                                                         'image.png')))
+
+    def test_collect_files_with_subdirectory(self):
+        """Testing collect_files copies matching files in subdirectories"""
+        with self.with_sphinx_env() as ctx:
+            app = ctx['app']
+            srcdir = str(ctx['srcdir'])
+
+            os.makedirs(os.path.join(srcdir, 'extra', 'files'))
+
+            self._write_file(os.path.join(srcdir, 'contents.rst'), '')
+            self._write_file(os.path.join(srcdir, 'extra', 'files',
+                                          'notes.txt'),
+                             'Notes')
+
+            app.build()
+
+            self.assertEqual(
+                self._read_file(os.path.join(str(app.outdir), 'extra',
+                                             'files', 'notes.txt')),
+                'Notes')
+
+    def test_collect_files_with_executable_file(self):
+        """Testing collect_files keeps executable files executable"""
+        with self.with_sphinx_env() as ctx:
+            app = ctx['app']
+            srcdir = str(ctx['srcdir'])
+            src_path = os.path.join(srcdir, 'script.txt')
+
+            self._write_file(os.path.join(srcdir, 'contents.rst'), '')
+            self._write_file(src_path, 'Script')
+            os.chmod(src_path, 0o755)
+
+            app.build()
+
+            self.assertTrue(os.access(os.path.join(str(app.outdir),
+                                                   'script.txt'),
+                                      os.X_OK))
+
+    def test_collect_files_with_unchanged_file(self):
+        """Testing collect_files skips copying files that are up-to-date"""
+        with self.with_sphinx_env() as ctx:
+            app = ctx['app']
+            srcdir = str(ctx['srcdir'])
+
+            self._write_file(os.path.join(srcdir, 'contents.rst'), '')
+            self._write_file(os.path.join(srcdir, 'notes.txt'), 'Notes')
+
+            app.build()
+
+            self.spy_on(shutil.copyfile)
+            app.build()
+
+            self.assertSpyNotCalled(shutil.copyfile)
+            self.assertEqual(
+                self._read_file(os.path.join(str(app.outdir), 'notes.txt')),
+                'Notes')
+
+    def test_collect_files_with_changed_file(self):
+        """Testing collect_files copies files again after they change"""
+        with self.with_sphinx_env() as ctx:
+            app = ctx['app']
+            srcdir = str(ctx['srcdir'])
+            src_path = os.path.join(srcdir, 'notes.txt')
+
+            self._write_file(os.path.join(srcdir, 'contents.rst'), '')
+            self._write_file(src_path, 'Notes')
+
+            app.build()
+
+            dest_path = os.path.join(str(app.outdir), 'notes.txt')
+
+            # Make sure the source is seen as newer than the copy, even on
+            # filesystems with coarse timestamps.
+            self._write_file(src_path, 'New notes')
+            dest_mtime = os.stat(dest_path).st_mtime
+            os.utime(src_path, (dest_mtime + 10, dest_mtime + 10))
+
+            self.spy_on(shutil.copyfile)
+            app.build()
+
+            self.assertSpyCallCount(shutil.copyfile, 1)
+            self.assertEqual(self._read_file(dest_path), 'New notes')
+
+    def _write_file(self, path, contents):
+        """Write a file for a test.
+
+        Args:
+            path (unicode):
+                The path to the file.
+
+            contents (unicode):
+                The contents to write.
+        """
+        with open(path, 'w') as fp:
+            fp.write(contents)
+
+    def _read_file(self, path):
+        """Return the contents of a file for a test.
+
+        Args:
+            path (unicode):
+                The path to the file.
+
+        Returns:
+            unicode:
+            The contents of the file.
+        """
+        with open(path, 'r') as fp:
+            return fp.read()
@@ -1,5 +1,8 @@
 """Unit tests for beanbag_docutils.sphinx.ext.github"""
 
+import ast
+import os
+
 import kgb
 
 from beanbag_docutils.sphinx.ext.github import (clear_github_linkcode_caches,
@@ -33,10 +36,8 @@ class GitHubLinkCodeResolveTests(kgb.SpyAgency, SphinxExtTestCase):
                 ),
             },
             {
-                'args': (['log', '--pretty=format:%H', '...abcd123'],),
-                'op': kgb.SpyOpReturn(
-                    b'157ac365d792c79987966e0152d16d6d1526b24d\n'
-                ),
+                'args': (['rev-list', '--count', '...abcd123'],),
+                'op': kgb.SpyOpReturn(b'1\n'),
             },
             {
                 'args': (['rev-parse', 'mybranch'],),
@@ -80,10 +81,8 @@ class GitHubLinkCodeResolveTests(kgb.SpyAgency, SphinxExtTestCase):
                 ),
             },
             {
-                'args': (['log', '--pretty=format:%H', '...abcd123'],),
-                'op': kgb.SpyOpReturn(
-                    b'157ac365d792c79987966e0152d16d6d1526b24d\n'
-                ),
+                'args': (['rev-list', '--count', '...abcd123'],),
+                'op': kgb.SpyOpReturn(b'1\n'),
             },
             {
                 'args': (['rev-parse', 'mybranch'],),
@@ -127,10 +126,8 @@ class GitHubLinkCodeResolveTests(kgb.SpyAgency, SphinxExtTestCase):
                 ),
             },
             {
-                'args': (['log', '--pretty=format:%H', '...abcd123'],),
-                'op': kgb.SpyOpReturn(
-                    b'157ac365d792c79987966e0152d16d6d1526b24d\n'
-                ),
+                'args': (['rev-list', '--count', '...abcd123'],),
+                'op': kgb.SpyOpReturn(b'1\n'),
             },
             {
                 'args': (['rev-parse', 'mybranch'],),
@@ -174,10 +171,8 @@ class GitHubLinkCodeResolveTests(kgb.SpyAgency, SphinxExtTestCase):
                 ),
             },
             {
-                'args': (['log', '--pretty=format:%H', '...abcd123'],),
-                'op': kgb.SpyOpReturn(
-                    b'157ac365d792c79987966e0152d16d6d1526b24d\n'
-                ),
+                'args': (['rev-list', '--count', '...abcd123'],),
+                'op': kgb.SpyOpReturn(b'1\n'),
             },
             {
                 'args': (['rev-parse', 'mybranch'],),
@@ -221,10 +216,8 @@ class GitHubLinkCodeResolveTests(kgb.SpyAgency, SphinxExtTestCase):
                 ),
             },
             {
-                'args': (['log', '--pretty=format:%H', '...abcd123'],),
-                'op': kgb.SpyOpReturn(
-                    b'157ac365d792c79987966e0152d16d6d1526b24d\n'
-                ),
+                'args': (['rev-list', '--count', '...abcd123'],),
+                'op': kgb.SpyOpReturn(b'1\n'),
             },
             {
                 'args': (['rev-parse', 'mybranch'],),
@@ -270,10 +263,8 @@ class GitHubLinkCodeResolveTests(kgb.SpyAgency, SphinxExtTestCase):
                 ),
             },
             {
-                'args': (['log', '--pretty=format:%H', '...abcd123'],),
-                'op': kgb.SpyOpReturn(
-                    b'157ac365d792c79987966e0152d16d6d1526b24d\n'
-                ),
+                'args': (['rev-list', '--count', '...abcd123'],),
+                'op': kgb.SpyOpReturn(b'1\n'),
             },
             {
                 'args': (['rev-parse', 'mybranch'],),
@@ -319,10 +310,8 @@ class GitHubLinkCodeResolveTests(kgb.SpyAgency, SphinxExtTestCase):
                 ),
             },
             {
-                'args': (['log', '--pretty=format:%H', '...abcd123'],),
-                'op': kgb.SpyOpReturn(
-                    b'157ac365d792c79987966e0152d16d6d1526b24d\n'
-                ),
+                'args': (['rev-list', '--count', '...abcd123'],),
+                'op': kgb.SpyOpReturn(b'1\n'),
             },
             {
                 'args': (['rev-parse', 'mybranch'],),
@@ -387,10 +376,8 @@ class GitHubLinkCodeResolveTests(kgb.SpyAgency, SphinxExtTestCase):
                 ),
             },
             {
-                'args': (['log', '--pretty=format:%H', '...abcd123'],),
-                'op': kgb.SpyOpReturn(
-                    b'157ac365d792c79987966e0152d16d6d1526b24d\n'
-                ),
+                'args': (['rev-list', '--count', '...abcd123'],),
+                'op': kgb.SpyOpReturn(b'1\n'),
             },
             {
                 'args': (['rev-parse', 'mybranch'],),
@@ -436,10 +423,8 @@ class GitHubLinkCodeResolveTests(kgb.SpyAgency, SphinxExtTestCase):
                 ),
             },
             {
-                'args': (['log', '--pretty=format:%H', '...abcd123'],),
-                'op': kgb.SpyOpReturn(
-                    b'157ac365d792c79987966e0152d16d6d1526b24d\n'
-                ),
+                'args': (['rev-list', '--count', '...abcd123'],),
+                'op': kgb.SpyOpReturn(b'1\n'),
             },
             {
                 'args': (['rev-parse', 'mybranch'],),
@@ -486,10 +471,8 @@ class GitHubLinkCodeResolveTests(kgb.SpyAgency, SphinxExtTestCase):
                 ),
             },
             {
-                'args': (['log', '--pretty=format:%H', '...abcd123'],),
-                'op': kgb.SpyOpReturn(
-                    b'157ac365d792c79987966e0152d16d6d1526b24d\n'
-                ),
+                'args': (['rev-list', '--count', '...abcd123'],),
+                'op': kgb.SpyOpReturn(b'1\n'),
             },
             {
                 'args': (['rev-parse', 'mybranch'],),
@@ -535,17 +518,12 @@ class GitHubLinkCodeResolveTests(kgb.SpyAgency, SphinxExtTestCase):
                 ),
             },
             {
-                'args': (['log', '--pretty=format:%H', '...abcd123'],),
-                'op': kgb.SpyOpReturn(
-                    b'abcd1235d792c79987966e0152d16d6d1526b24d\n'
-                    b'55ca6286e3e4f4fba5d0448333fa99fc5a404a73\n'
-                ),
+                'args': (['rev-list', '--count', '...abcd123'],),
+                'op': kgb.SpyOpReturn(b'2\n'),
             },
             {
-                'args': (['log', '--pretty=format:%H', '...def4567'],),
-                'op': kgb.SpyOpReturn(
-                    b'def45675d792c79987966e0152d16d6d1526b24d\n'
-                ),
+                'args': (['rev-list', '--count', '...def4567'],),
+                'op': kgb.SpyOpReturn(b'1\n'),
             },
             {
                 'args': (['rev-parse', 'mybranch-dev'],),
@@ -577,6 +555,121 @@ class GitHubLinkCodeResolveTests(kgb.SpyAgency, SphinxExtTestCase):
 
         self.assertSpyCallCount(_run_git, 5)
 
+    def test_with_multiple_branches(self):
+        """Testing github_linkcode_resolve with different branches"""
+        self.spy_on(_run_git, op=kgb.SpyOpMatchInOrder([
+            {
+                'args': (['fetch', 'origin', 'release-1.x:release-1.x'],),
+                'call_original': False,
+            },
+            {
+                'args': (['branch', '-rv', '--contains', 'release-1.x'],),
+                'op': kgb.SpyOpReturn(
+                    b'  origin/release-1.x abcd123 Here is a commit.\n'
+                ),
+            },
+            {
+                'args': (['rev-list', '--count', '...abcd123'],),
+                'op': kgb.SpyOpReturn(b'1\n'),
+            },
+            {
+                'args': (['rev-parse', 'release-1.x'],),
+                'op': kgb.SpyOpReturn(
+                    b'157ac365d792c79987966e0152d16d6d1526b24d\n'
+                ),
+            },
+            {
+                'args': (['fetch', 'origin', 'release-2.x:release-2.x'],),
+                'call_original': False,
+            },
+            {
+                'args': (['branch', '-rv', '--contains', 'release-2.x'],),
+                'op': kgb.SpyOpReturn(
+                    b'  origin/release-2.x def4567 Here is a commit.\n'
+                ),
+            },
+            {
+                'args': (['rev-list', '--count', '...def4567'],),
+                'op': kgb.SpyOpReturn(b'1\n'),
+            },
+            {
+                'args': (['rev-parse', 'release-2.x'],),
+                'op': kgb.SpyOpReturn(
+                    b'55ca6286e3e4f4fba5d0448333fa99fc5a404a73\n'
+                ),
+            },
+        ]))
+
+        expected_refs = [
+            ('release-1.x', '157ac365d792c79987966e0152d16d6d1526b24d'),
+            ('release-2.x', '55ca6286e3e4f4fba5d0448333fa99fc5a404a73'),
+        ]
+
+        # Resolve each branch twice, to check that the refs are cached
+        # separately for each branch.
+        for i in range(2):
+            for branch, ref in expected_refs:
+                url = github_linkcode_resolve(
+                    domain='py',
+                    info={
+                        'module': self.SRC_MODULE,
+                        'fullname': 'ClassB',
+                    },
+                    github_org_id='beanbaginc',
+                    github_repo_id='beanbag_docutils',
+                    branch=branch)
+
+                self.assertEqual(
+                    url,
+                    'https://github.com/beanbaginc/beanbag_docutils/blob/'
+                    '%s/beanbag_docutils/sphinx/ext/tests/testdata/'
+                    'github_linkcode_module.py#L9'
+                    % ref)
+
+        self.assertSpyCallCount(_run_git, 8)
+
+    def test_with_skip_fetch(self):
+        """Testing github_linkcode_resolve with BEANBAG_DOCUTILS_SKIP_FETCH"""
+        os.environ['BEANBAG_DOCUTILS_SKIP_FETCH'] = '1'
+        self.addCleanup(os.environ.pop, 'BEANBAG_DOCUTILS_SKIP_FETCH')
+
+        self.spy_on(_run_git, op=kgb.SpyOpMatchInOrder([
+            {
+                'args': (['branch', '-rv', '--contains', 'mybranch'],),
+                'op': kgb.SpyOpReturn(
+                    b'  origin/mybranch abcd123 Here is a commit.\n'
+                ),
+            },
+            {
+                'args': (['rev-list', '--count', '...abcd123'],),
+                'op': kgb.SpyOpReturn(b'1\n'),
+            },
+            {
+                'args': (['rev-parse', 'mybranch'],),
+                'op': kgb.SpyOpReturn(
+                    b'55ca6286e3e4f4fba5d0448333fa99fc5a404a73\n'
+                ),
+            },
+        ]))
+
+        url = github_linkcode_resolve(
+            domain='py',
+            info={
+                'module': self.SRC_MODULE,
+                'fullname': 'ClassB',
+            },
+            github_org_id='beanbaginc',
+            github_repo_id='beanbag_docutils',
+            branch='mybranch')
+
+        self.assertEqual(
+            url,
+            'https://github.com/beanbaginc/beanbag_docutils/blob/'
+            '55ca6286e3e4f4fba5d0448333fa99fc5a404a73/beanbag_docutils/'
+            'sphinx/ext/tests/testdata/github_linkcode_module.py#L9')
+
+        self.assertSpyCallCount(_run_git, 3)
+
     def test_with_tracking_branch_not_found(self):
         """Testing github_linkcode_resolve with tracking branch not found"""
         self.spy_on(_run_git, op=kgb.SpyOpMatchInOrder([
@@ -638,6 +731,26 @@ class GitHubLinkCodeResolveTests(kgb.SpyAgency, SphinxExtTestCase):
 
         self.assertIsNone(url)
 
+    def test_with_no_fullname(self):
+        """Testing github_linkcode_resolve with no fullname"""
+        self.spy_on(_run_git, call_original=False)
+        self.spy_on(ast.parse)
+
+        url = github_linkcode_resolve(
+            domain='py',
+            info={
+                'module': self.SRC_MODULE,
+                'fullname': '',
+            },
+            github_org_id='beanbaginc',
+            github_repo_id='beanbag_docutils',
+            branch='mybranch',
+            source_prefix='foo/bar/')
+
+        self.assertIsNone(url)
+        self.assertSpyNotCalled(ast.parse)
+        self.assertSpyNotCalled(_run_git)
+
     def test_with_module_not_found(self):
         """Testing github_linkcode_resolve with module not found"""
         self.spy_on(_run_git, call_original=False)
@@ -671,3 +784,50 @@ class GitHubLinkCodeResolveTests(kgb.SpyAgency, SphinxExtTestCase):
             source_prefix='foo/bar/')
 
         self.assertIsNone(url)
+
+    def test_with_cached_ast(self):
+        """Testing github_linkcode_resolve re-uses parsed module ASTs"""
+        self.spy_on(_run_git, op=kgb.SpyOpMatchInOrder([
+            {
+                'args': (['fetch', 'origin', 'mybranch', 'origin'],),
+                'call_original': False,
+            },
+            {
+                'args': (['branch', '-rv', '--contains', 'mybranch'],),
+                'op': kgb.SpyOpReturn(
+                    b'  origin/mybranch abcd123 Here is a commit.\n'
+                ),
+            },
+            {
+                'args': (['rev-list', '--count', '...abcd123'],),
+                'op': kgb.SpyOpReturn(b'1\n'),
+            },
+            {
+                'args': (['rev-parse', 'mybranch'],),
+                'op': kgb.SpyOpReturn(
+                    b'55ca6286e3e4f4fba5d0448333fa99fc5a404a73\n'
+                ),
+            },
+        ]))
+        self.spy_on(ast.parse)
+
+        for fullname, lineno in (('ClassB', 9), ('ClassB.do_thing', 17)):
+            url = github_linkcode_resolve(
+                domain='py',
+                info={
+                    'module': self.SRC_MODULE,
+                    'fullname': fullname,
+                },
+                github_org_id='beanbaginc',
+                github_repo_id='beanbag_docutils',
+                branch='mybranch')
+
+            self.assertEqual(
+                url,
+                'https://github.com/beanbaginc/beanbag_docutils/blob/'
+                '55ca6286e3e4f4fba5d0448333fa99fc5a404a73/beanbag_docutils/'
+                'sphinx/ext/tests/testdata/github_linkcode_module.py#L%d'
+                % lineno)
+
+        self.assertSpyCallCount(ast.parse, 1)
+        self.assertSpyCallCount(_run_git, 4)
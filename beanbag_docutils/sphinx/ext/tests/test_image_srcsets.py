@@ -35,6 +35,19 @@ class ImageTests(SphinxExtTestCase):
             ' _images/image%403x.png 3x" alt="_images/image.png"'
             ' src="_images/image.png" />')
 
+    def test_with_html_and_srcset_malformed_entry(self):
+        """Testing image-srcset with HTML and srcset with a malformed entry"""
+        rendered = self.render_doc(
+            '.. image:: path/to/image.png\n'
+            '   :sources: 2x path/to/image@2x.png\n'
+            '             path/to/image@3x.png\n'
+        )
+
+        self.assertEqual(
+            rendered,
+            '<img srcset="_images/image.png 1x, _images/image%402x.png 2x"'
+            ' alt="_images/image.png" src="_images/image.png" />')
+
     def test_with_html_and_srcset_files(self):
         """Testing image-srcset with HTML and srcset @-based files"""
         rendered = self.render_doc(
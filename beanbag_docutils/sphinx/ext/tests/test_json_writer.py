@@ -126,6 +126,81 @@ class JsonWriterTests(SphinxExtTestCase):
                 },
             ])
 
+    def test_toc_with_shared_child(self):
+        """Testing json_writer with toc and a page in multiple toctrees"""
+        files = {
+            'contents.rst': '',
+            'index.rst': (
+                '========\n'
+                'Top Page\n'
+                '========\n'
+                '\n'
+                '.. toctree::\n'
+                '\n'
+                '   page1\n'
+                '   page2\n'
+            ),
+            'page1.rst': (
+                '======\n'
+                'Page 1\n'
+                '======\n'
+                '\n'
+                '.. toctree::\n'
+                '\n'
+                '   shared\n'
+            ),
+            'page2.rst': (
+                '======\n'
+                'Page 2\n'
+                '======\n'
+                '\n'
+                '.. toctree::\n'
+                '\n'
+                '   shared\n'
+            ),
+            'shared.rst': (
+                '======\n'
+                'Shared\n'
+                '======\n'
+            ),
+        }
+
+        with self.rendered_docs(files=files,
+                                builder_name='json') as build_dir:
+            with open(os.path.join(build_dir, 'globalcontext.json'),
+                      'r') as fp:
+                global_context = json.load(fp)
+
+            self.assertIn('toc', global_context)
+            self.assertEqual(global_context['toc'], [
+                {
+                    'docname': 'index',
+                    'title': 'Top Page',
+                    'items': [
+                        {
+                            'docname': 'page1',
+                            'title': 'Page 1',
+                            'items': [
+                                {
+                                    'docname': 'shared',
+                                    'title': 'Shared',
+                                },
+                            ],
+                        },
+                        {
+                            'docname': 'page2',
+                            'title': 'Page 2',
+                            'items': [
+                                {
+                                    'docname': 'shared',
+                                    'title': 'Shared',
+                                },
+                            ],
+                        },
+                    ],
+                },
+            ])
+
     def test_toc_with_no_children(self):
         """Testing json_writer with toc and no children"""
         files = {